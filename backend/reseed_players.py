@@ -1,11 +1,12 @@
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, WriteConcern
 import os
 from dotenv import load_dotenv
 from pathlib import Path
 import random
-import requests
-import base64
+import uuid
+import httpx
+import numpy as np
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -13,25 +14,33 @@ load_dotenv(ROOT_DIR / '.env')
 mongo_url = os.environ['MONGO_URL']
 db_name = os.environ['DB_NAME']
 
-def image_url_to_base64(url: str) -> str:
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            return base64.b64encode(response.content).decode('utf-8')
-    except:
-        pass
-    return ""
+POSITION_NAMES = {
+    "S": "Setter",
+    "OH": "Outside Hitter",
+    "OPP": "Opposite Hitter",
+    "MB": "Middle Blocker",
+    "L": "Libero",
+    "DS": "Defensive Specialist"
+}
 
-async def reseed_players():
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-    
-    # Clear existing players and lineups
-    print("Clearing existing players and lineups...")
-    await db.players.delete_many({})
-    await db.lineups.delete_many({})
-    print("Cleared!")
-    
+async def fetch_image(client: httpx.AsyncClient, url: str, sem: asyncio.Semaphore) -> bytes:
+    async with sem:
+        try:
+            response = await client.get(url, timeout=10)
+            if response.status_code == 200:
+                return response.content
+        except Exception:
+            pass
+    return b""
+
+def count_by_position(players: list) -> dict:
+    return {
+        name: sum(1 for p in players if p["position"] == pos)
+        for pos, name in POSITION_NAMES.items()
+    }
+
+async def generate_players() -> list:
+    """Build the full seed roster, downloading player images concurrently."""
     # Player images from Unsplash - volleyball themed
     image_urls = [
         "https://images.unsplash.com/photo-1599509055064-8a742910930a?w=400",
@@ -45,37 +54,29 @@ async def reseed_players():
         "https://images.unsplash.com/photo-1587280501635-68a0e82cd5ff?w=400",
         "https://images.unsplash.com/photo-1593786481097-7e512db2cada?w=400",
     ]
-    
-    positions = ["S", "OH", "OPP", "MB", "L", "DS"]
-    position_names = {
-        "S": "Setter",
-        "OH": "Outside Hitter", 
-        "OPP": "Opposite Hitter",
-        "MB": "Middle Blocker",
-        "L": "Libero",
-        "DS": "Defensive Specialist"
-    }
-    
+
+    positions = list(POSITION_NAMES)
+
     teams = [
-        "Phoenix Fire", "Wave Riders", "Thunder Storm", "Lightning Bolts", 
+        "Phoenix Fire", "Wave Riders", "Thunder Storm", "Lightning Bolts",
         "Sky Hawks", "Ocean Warriors", "Desert Eagles", "Mountain Lions",
         "Storm Chasers", "Coastal Crushers"
     ]
-    
+
     first_names = [
         "Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Avery", "Quinn", "Blake", "Drew",
         "Cameron", "Sage", "River", "Sky", "Phoenix", "Dakota", "Kai", "Rowan", "Hayden", "Parker",
         "Emerson", "Finley", "Logan", "Peyton", "Reese", "Ryan", "Sawyer", "Spencer", "Tatum", "Wren",
         "Charlie", "Jamie", "Ellis", "Kendall", "Dylan", "Harper", "Bailey", "Sidney", "Skyler", "Sam"
     ]
-    
+
     last_names = [
         "Chen", "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
         "Martinez", "Lee", "Kim", "Park", "Patel", "Singh", "Wang", "Liu", "Nguyen", "Anderson",
         "Taylor", "Thomas", "Moore", "Jackson", "Martin", "Thompson", "White", "Harris", "Clark", "Lewis",
         "Walker", "Hall", "Allen", "Young", "King", "Wright", "Lopez", "Hill", "Green", "Adams"
     ]
-    
+
     bios = [
         "A powerful attacker with exceptional court vision and leadership skills.",
         "Known for lightning-fast reflexes and pinpoint serving accuracy.",
@@ -93,88 +94,99 @@ async def reseed_players():
         "Explosive attacker with a wide range of shots.",
         "Steady presence who brings calm under pressure."
     ]
-    
+
+    # Download all images concurrently - only the unique URLs, then look up by index
+    unique_urls = list(dict.fromkeys(image_urls))
+    sem = asyncio.Semaphore(8)  # stay under Unsplash rate limits
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=20)) as http_client:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_image(http_client, url, sem)) for url in unique_urls]
+    url_to_image = dict(zip(unique_urls, [t.result() for t in tasks]))
+
     players = []
     random.seed(42)  # For consistent random generation
-    
+
     # Generate 30-35 players
     num_players = random.randint(30, 35)
-    print(f"Generating {num_players} players...")
-    
-    used_names = set()
-    used_jerseys = set()
-    
+
+    # Sample without replacement - uniqueness is guaranteed, no retry loops
+    all_names = [f"{first} {last}" for first in first_names for last in last_names]
+    names = random.sample(all_names, num_players)
+    jerseys = random.sample(range(1, 100), num_players)
+
+    # Vectorize the numeric columns - one RNG call per column instead of
+    # one per player. Credit cost bounds are indexed by position
+    # (strategically distributed). tolist() converts back to plain Python
+    # types, which BSON requires.
+    rng = np.random.default_rng(42)
+    pos_idx = np.arange(num_players) % len(positions)
+    credit_bounds = np.array([[12, 20], [15, 25], [15, 25], [10, 18], [8, 15], [7, 14]])
+    credits = rng.integers(credit_bounds[pos_idx, 0], credit_bounds[pos_idx, 1] + 1).tolist()
+    team_picks = rng.choice(teams, num_players).tolist()
+    bio_picks = rng.choice(bios, num_players).tolist()
+    matches = rng.integers(50, 201, num_players).tolist()
+    sets_played = rng.integers(100, 501, num_players).tolist()
+    kills = rng.uniform(1.5, 5.5, num_players).round(2).tolist()
+    digs = rng.uniform(1.0, 4.5, num_players).round(2).tolist()
+    blocks = rng.uniform(0.3, 2.8, num_players).round(2).tolist()
+    aces = rng.uniform(0.2, 1.8, num_players).round(2).tolist()
+
     for i in range(num_players):
         position = positions[i % len(positions)]
-        
-        # Generate unique name
-        attempts = 0
-        while attempts < 100:
-            name = f"{random.choice(first_names)} {random.choice(last_names)}"
-            if name not in used_names:
-                used_names.add(name)
-                break
-            attempts += 1
-        
-        # Generate unique jersey number
-        attempts = 0
-        while attempts < 100:
-            jersey = random.randint(1, 99)
-            if jersey not in used_jerseys:
-                used_jerseys.add(jersey)
-                break
-            attempts += 1
-        
-        # Credit costs vary by position (strategically distributed)
-        if position == "S":
-            credit_cost = random.randint(12, 20)
-        elif position in ["OH", "OPP"]:
-            credit_cost = random.randint(15, 25)
-        elif position == "MB":
-            credit_cost = random.randint(10, 18)
-        elif position == "L":
-            credit_cost = random.randint(8, 15)
-        else:  # DS
-            credit_cost = random.randint(7, 14)
-        
-        print(f"Creating player {i+1}/{num_players}: {name} ({position})...")
-        
+
         player = {
-            "name": name,
-            "jerseyNumber": jersey,
+            "_id": str(uuid.uuid4()),
+            "name": names[i],
+            # Case-folded copy so search is an index range scan on a plain index
+            "name_lower": names[i].lower(),
+            "jerseyNumber": jerseys[i],
             "position": position,
-            "positionName": position_names[position],
-            "teamName": random.choice(teams),
-            "creditCost": credit_cost,
-            "bio": random.choice(bios),
-            "imageBase64": image_url_to_base64(image_urls[i % len(image_urls)]),
+            "positionName": POSITION_NAMES[position],
+            "teamName": team_picks[i],
+            "creditCost": credits[i],
+            "bio": bio_picks[i],
+            # Raw bytes land as BSON Binary - a third smaller than base64 text
+            "image": url_to_image[image_urls[i % len(image_urls)]],
+            "imageUrl": image_urls[i % len(image_urls)],
             "stats": {
-                "matches": random.randint(50, 200),
-                "sets": random.randint(100, 500),
-                "kills_per_set": round(random.uniform(1.5, 5.5), 2),
-                "digs_per_set": round(random.uniform(1.0, 4.5), 2),
-                "blocks_per_set": round(random.uniform(0.3, 2.8), 2),
-                "aces_per_set": round(random.uniform(0.2, 1.8), 2)
+                "matches": matches[i],
+                "sets": sets_played[i],
+                "kills_per_set": kills[i],
+                "digs_per_set": digs[i],
+                "blocks_per_set": blocks[i],
+                "aces_per_set": aces[i]
             }
         }
         players.append(player)
-    
+
+    return players
+
+async def reseed_players():
+    client = AsyncMongoClient(mongo_url)
+    db = client[db_name]
+
+    # Clear existing players and lineups
+    print("Clearing existing players and lineups...")
+    await db.players.delete_many({})
+    await db.lineups.delete_many({})
+    print("Cleared!")
+
+    print("Generating players...")
+    players = await generate_players()
+
     print(f"\nInserting {len(players)} players into database...")
-    await db.players.insert_many(players)
-    
-    # Count players by position
-    position_counts = {}
-    for pos in positions:
-        count = sum(1 for p in players if p["position"] == pos)
-        position_counts[position_names[pos]] = count
-    
+    # Fire-and-forget write concern is fine for seed data and skips the ack round trip
+    await db.get_collection('players', write_concern=WriteConcern(w=0)).insert_many(players, ordered=False)
+
+    position_counts = count_by_position(players)
+
     print("\n✅ SUCCESS!")
     print(f"Total players: {len(players)}")
     print("\nPlayers by position:")
     for pos_name, count in position_counts.items():
         print(f"  {pos_name}: {count}")
-    
-    client.close()
+
+    await client.close()
 
 if __name__ == "__main__":
     asyncio.run(reseed_players())
@@ -1,27 +1,46 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+import asyncio
+import hashlib
+import hmac
+import orjson
 import os
 import logging
+import re
+import time
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 import bcrypt
 import jwt
-from bson import ObjectId
-import requests
-import base64
-from io import BytesIO
+from pymongo import WriteConcern
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib encoder
+except ImportError:
+    import base64
+import uuid
+from reseed_players import generate_players, count_by_position
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection - modest pool for a handful of short endpoints, with
+# wire compression so the base64-heavy player docs shrink on the wire
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=5,
+    retryWrites=True,
+    compressors="zstd,zlib"
+)
 db = client[os.environ['DB_NAME']]
 
 # JWT Configuration
@@ -29,7 +48,7 @@ SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-product
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 security = HTTPBearer()
 
@@ -66,6 +85,20 @@ class Player(BaseModel):
     creditCost: int
     bio: str
     imageBase64: str
+    imageUrl: Optional[str] = None
+    stats: PlayerStats
+
+class PlayerListItem(BaseModel):
+    # List view of a player - carries the image URL instead of the
+    # ~7-10 KB base64 blob so the /players payload stays small
+    id: str
+    name: str
+    jerseyNumber: int
+    position: str
+    teamName: str
+    creditCost: int
+    bio: str
+    imageUrl: Optional[str] = None
     stats: PlayerStats
 
 class LineupSlot(BaseModel):
@@ -84,6 +117,8 @@ class Lineup(BaseModel):
     remaining: int = 100
     updatedAt: datetime = Field(default_factory=datetime.utcnow)
 
+LINEUP_FIELDS = ("setter", "outsideHitter", "oppositeHitter", "middleBlocker", "libero", "defensiveSpecialist")
+
 class SaveLineupRequest(BaseModel):
     setter: Optional[str] = None
     outsideHitter: Optional[str] = None
@@ -92,63 +127,122 @@ class SaveLineupRequest(BaseModel):
     libero: Optional[str] = None
     defensiveSpecialist: Optional[str] = None
 
+# bcrypt releases the GIL, so run it on a thread pool instead of blocking the event loop
+password_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Work factor is tunable per deployment; 12 is the bcrypt default
+BCRYPT_COST = int(os.environ.get('BCRYPT_COST', '12'))
+
+# Computed once at import; verified against when a signin email does not exist
+# so unknown emails take as long as wrong passwords
+DUMMY_PASSWORD_HASH = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(rounds=BCRYPT_COST))
+
 # Helper Functions
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+async def hash_password(password: str) -> bytes:
+    # Hashes stay bytes end to end - BSON stores them natively, so there is
+    # no utf-8 decode on write or encode on every verify
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_executor, bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_COST)
+    )
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+async def verify_password(password: str, hashed: bytes) -> bool:
+    if isinstance(hashed, str):  # hashes stored before the bytes switch
+        hashed = hashed.encode('utf-8')
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_executor, bcrypt.checkpw, password.encode('utf-8'), hashed
+    )
+
+# Every token we issue shares the same HS256 header, so encode it once
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
 
 def create_access_token(data: dict) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    # Hand-rolled HS256 encode: cached header, orjson payload, one HMAC.
+    # Stays verifiable by jwt.decode in get_current_user
+    expire = int(time.time()) + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    payload = base64.urlsafe_b64encode(orjson.dumps(data | {"exp": expire})).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + payload
+    signature = hmac.new(SECRET_KEY.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode('ascii')
+
+# Verified tokens, keyed by token digest; entries never outlive the token's exp
+_auth_cache = TTLCache(maxsize=10000, ttl=60)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # The signed token already carries the user's identity, so there is no
+    # need to re-fetch the user document from Mongo on every request
     token = credentials.credentials
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    user = _auth_cache.get(cache_key)
+    if user is not None:
+        return user
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
-        user = await db.users.find_one({"_id": ObjectId(user_id)})
-        if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
+        user = {"_id": user_id, "email": payload.get("email"), "name": payload.get("name")}
+        # Only cache tokens that will outlive the cache TTL, so a cached hit
+        # can never be served after its token expired
+        if payload.get("exp", 0) - time.time() > _auth_cache.ttl:
+            _auth_cache[cache_key] = user
         return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-def image_url_to_base64(url: str) -> str:
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            return base64.b64encode(response.content).decode('utf-8')
-    except:
-        pass
-    return ""
+def _to_player(p: dict) -> Player:
+    # Docs come from our own DB, so model_construct skips re-validation.
+    # Images live in Mongo as raw bytes; the API contract stays base64
+    image = p.get("image")
+    return Player.model_construct(
+        id=p["_id"],
+        name=p["name"],
+        jerseyNumber=p["jerseyNumber"],
+        position=p["position"],
+        teamName=p["teamName"],
+        creditCost=p["creditCost"],
+        bio=p["bio"],
+        imageBase64=base64.b64encode(image).decode('ascii') if image else "",
+        imageUrl=p.get("imageUrl"),
+        stats=PlayerStats.model_construct(**p["stats"])
+    )
+
+def _to_player_list_item(p: dict) -> PlayerListItem:
+    return PlayerListItem.model_construct(
+        id=p["_id"],
+        name=p["name"],
+        jerseyNumber=p["jerseyNumber"],
+        position=p["position"],
+        teamName=p["teamName"],
+        creditCost=p["creditCost"],
+        bio=p["bio"],
+        imageUrl=p.get("imageUrl"),
+        stats=PlayerStats.model_construct(**p["stats"])
+    )
 
 # Auth Routes
 @api_router.post("/auth/signup", response_model=UserResponse)
 async def signup(user_data: UserSignUp):
-    existing_user = await db.users.find_one({"email": user_data.email})
+    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_pw = hash_password(user_data.password)
+    hashed_pw = await hash_password(user_data.password)
+    user_id = str(uuid.uuid4())
     user_doc = {
+        "_id": user_id,
         "email": user_data.email,
         "password": hashed_pw,
         "name": user_data.name,
         "createdAt": datetime.utcnow()
     }
-    result = await db.users.insert_one(user_doc)
-    user_id = str(result.inserted_id)
-    
-    token = create_access_token({"sub": user_id})
+    await db.users.insert_one(user_doc)
     
+    token = create_access_token({"sub": user_id, "email": user_data.email, "name": user_data.name})
+
     return UserResponse(
         id=user_id,
         email=user_data.email,
@@ -158,12 +252,16 @@ async def signup(user_data: UserSignUp):
 
 @api_router.post("/auth/signin", response_model=UserResponse)
 async def signin(credentials: UserSignIn):
-    user = await db.users.find_one({"email": credentials.email})
-    if not user or not verify_password(credentials.password, user["password"]):
+    user = await db.users.find_one({"email": credentials.email}, {"password": 1, "email": 1, "name": 1})
+    # Always run exactly one bcrypt check, against a dummy hash when the email
+    # is unknown, so both failure modes take the same time
+    hashed = user["password"] if user else DUMMY_PASSWORD_HASH
+    password_ok = await verify_password(credentials.password, hashed)
+    if not user or not password_ok:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     user_id = str(user["_id"])
-    token = create_access_token({"sub": user_id})
+    token = create_access_token({"sub": user_id, "email": user["email"], "name": user["name"]})
     
     return UserResponse(
         id=user_id,
@@ -173,55 +271,62 @@ async def signin(credentials: UserSignIn):
     )
 
 # Player Routes
-@api_router.get("/players", response_model=List[Player])
+
+# Built list responses keyed by (position, sortBy); cleared on reseed
+_players_cache = TTLCache(maxsize=256, ttl=30)
+@api_router.get("/players", response_model=List[PlayerListItem])
 async def get_players(
     position: Optional[str] = None,
     search: Optional[str] = None,
     sortBy: Optional[str] = "name",
     user: dict = Depends(get_current_user)
 ):
+    # The catalog only changes on seeding, so cache the built responses.
+    # Search queries are user-controlled keyspace and skip the cache.
+    cache_key = (position, sortBy)
+    if not search:
+        cached = _players_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     query = {}
     if position:
         query["position"] = position
     if search:
-        query["name"] = {"$regex": search, "$options": "i"}
-    
+        # Literalize user input, case-fold, and anchor the pattern so the
+        # name_lower index serves it as a range scan
+        query["name_lower"] = {"$regex": f"^{re.escape(search.lower())}"}
+
     sort_field = sortBy if sortBy in ["name", "creditCost"] else "name"
-    
-    players = await db.players.find(query).sort(sort_field, 1).to_list(100)
-    
-    return [
-        Player(
-            id=str(p["_id"]),
-            name=p["name"],
-            jerseyNumber=p["jerseyNumber"],
-            position=p["position"],
-            teamName=p["teamName"],
-            creditCost=p["creditCost"],
-            bio=p["bio"],
-            imageBase64=p["imageBase64"],
-            stats=PlayerStats(**p["stats"])
-        )
-        for p in players
-    ]
+
+    # Leave the heavy image bytes in Mongo - the list view only needs the URL
+    players = await db.players.find(query, {"image": 0}).sort(sort_field, 1).to_list(100)
+
+    result = [_to_player_list_item(p) for p in players]
+    if not search:
+        _players_cache[cache_key] = result
+    return result
+
+@api_router.get("/players/{player_id}/image")
+async def get_player_image(player_id: str, user: dict = Depends(get_current_user)):
+    player = await db.players.find_one({"_id": player_id}, {"image": 1})
+    if not player or not player.get("image"):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    # Raw bytes with a long cache lifetime so clients and CDNs can cache
+    return Response(
+        content=bytes(player["image"]),
+        media_type="image/jpeg",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
 
 @api_router.get("/players/{player_id}", response_model=Player)
 async def get_player(player_id: str, user: dict = Depends(get_current_user)):
-    player = await db.players.find_one({"_id": ObjectId(player_id)})
+    player = await db.players.find_one({"_id": player_id})
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
-    
-    return Player(
-        id=str(player["_id"]),
-        name=player["name"],
-        jerseyNumber=player["jerseyNumber"],
-        position=player["position"],
-        teamName=player["teamName"],
-        creditCost=player["creditCost"],
-        bio=player["bio"],
-        imageBase64=player["imageBase64"],
-        stats=PlayerStats(**player["stats"])
-    )
+
+    return _to_player(player)
 
 # Lineup Routes
 @api_router.post("/lineup/save")
@@ -229,37 +334,28 @@ async def save_lineup(lineup_data: SaveLineupRequest, user: dict = Depends(get_c
     user_id = str(user["_id"])
     
     # Fetch all selected players
-    player_ids = []
-    for field in ["setter", "outsideHitter", "oppositeHitter", "middleBlocker", "libero", "defensiveSpecialist"]:
-        pid = getattr(lineup_data, field)
-        if pid:
-            player_ids.append(ObjectId(pid))
-    
+    player_ids = [getattr(lineup_data, field) for field in LINEUP_FIELDS if getattr(lineup_data, field)]
+
     if len(player_ids) != 6:
         raise HTTPException(status_code=400, detail="All 6 positions must be filled")
     
-    players = await db.players.find({"_id": {"$in": player_ids}}).to_list(10)
-    player_map = {str(p["_id"]): p for p in players}
-    
+    players = await db.players.find({"_id": {"$in": player_ids}}, {"creditCost": 1}).to_list(length=6)
+    player_map = {p["_id"]: p for p in players}
+
     # Calculate total credits
-    total_credits = sum(player_map[str(pid)]["creditCost"] for pid in player_ids)
+    total_credits = sum(player_map[pid]["creditCost"] for pid in player_ids)
     
     if total_credits > 100:
         raise HTTPException(status_code=400, detail=f"Budget exceeded. Total: {total_credits}/100")
     
     # Build lineup document
-    lineup_doc = {
+    lineup_doc = {field: getattr(lineup_data, field) for field in LINEUP_FIELDS}
+    lineup_doc.update({
         "userId": user_id,
-        "setter": lineup_data.setter,
-        "outsideHitter": lineup_data.outsideHitter,
-        "oppositeHitter": lineup_data.oppositeHitter,
-        "middleBlocker": lineup_data.middleBlocker,
-        "libero": lineup_data.libero,
-        "defensiveSpecialist": lineup_data.defensiveSpecialist,
         "creditsUsed": total_credits,
         "remaining": 100 - total_credits,
         "updatedAt": datetime.utcnow()
-    }
+    })
     
     # Upsert lineup
     await db.lineups.update_one(
@@ -273,58 +369,43 @@ async def save_lineup(lineup_data: SaveLineupRequest, user: dict = Depends(get_c
 @api_router.get("/lineup")
 async def get_lineup(user: dict = Depends(get_current_user)):
     user_id = str(user["_id"])
-    lineup = await db.lineups.find_one({"userId": user_id})
-    
-    if not lineup:
-        return {
-            "setter": None,
-            "outsideHitter": None,
-            "oppositeHitter": None,
-            "middleBlocker": None,
-            "libero": None,
-            "defensiveSpecialist": None,
-            "creditsUsed": 0,
-            "remaining": 100
-        }
-    
-    # Fetch player details
-    player_ids = []
-    position_map = {}
-    for field in ["setter", "outsideHitter", "oppositeHitter", "middleBlocker", "libero", "defensiveSpecialist"]:
-        pid = lineup.get(field)
-        if pid:
-            player_ids.append(ObjectId(pid))
-            position_map[pid] = field
-    
-    players = await db.players.find({"_id": {"$in": player_ids}}).to_list(10)
-    player_data = {}
-    for p in players:
-        player_data[str(p["_id"])] = Player(
-            id=str(p["_id"]),
-            name=p["name"],
-            jerseyNumber=p["jerseyNumber"],
-            position=p["position"],
-            teamName=p["teamName"],
-            creditCost=p["creditCost"],
-            bio=p["bio"],
-            imageBase64=p["imageBase64"],
-            stats=PlayerStats(**p["stats"])
-        )
-    
-    return {
-        "setter": player_data.get(lineup.get("setter")) if lineup.get("setter") else None,
-        "outsideHitter": player_data.get(lineup.get("outsideHitter")) if lineup.get("outsideHitter") else None,
-        "oppositeHitter": player_data.get(lineup.get("oppositeHitter")) if lineup.get("oppositeHitter") else None,
-        "middleBlocker": player_data.get(lineup.get("middleBlocker")) if lineup.get("middleBlocker") else None,
-        "libero": player_data.get(lineup.get("libero")) if lineup.get("libero") else None,
-        "defensiveSpecialist": player_data.get(lineup.get("defensiveSpecialist")) if lineup.get("defensiveSpecialist") else None,
+
+    # Join the lineup with its player docs server-side in one round trip
+    pipeline = [
+        {"$match": {"userId": user_id}},
+        {"$lookup": {
+            "from": "players",
+            "let": {"pids": [f"${field}" for field in LINEUP_FIELDS]},
+            "pipeline": [
+                {"$match": {"$expr": {"$in": ["$_id", "$$pids"]}}}
+            ],
+            "as": "playerDocs"
+        }}
+    ]
+    cursor = await db.lineups.aggregate(pipeline)
+    results = await cursor.to_list(1)
+
+    if not results:
+        return {field: None for field in LINEUP_FIELDS} | {"creditsUsed": 0, "remaining": 100}
+
+    lineup = results[0]
+    player_data = {p["_id"]: _to_player(p) for p in lineup["playerDocs"]}
+
+    return {field: player_data.get(lineup.get(field)) for field in LINEUP_FIELDS} | {
         "creditsUsed": lineup.get("creditsUsed", 0),
         "remaining": lineup.get("remaining", 100)
     }
 
+# Serializes seeding so two concurrent calls cannot both pass the count check
+seed_lock = asyncio.Lock()
+
 # Seed Players Endpoint
 @api_router.post("/seed-players")
 async def seed_players(force: bool = False):
+    async with seed_lock:
+        return await _seed_players(force)
+
+async def _seed_players(force: bool):
     # Clear existing players if force=true
     if force:
         await db.players.delete_many({})
@@ -333,139 +414,16 @@ async def seed_players(force: bool = False):
         existing = await db.players.count_documents({})
         if existing > 0:
             return {"message": f"Players already seeded ({existing} players exist). Use force=true to reseed."}
-    
-    # Player images from Unsplash - volleyball themed
-    image_urls = [
-        "https://images.unsplash.com/photo-1599509055064-8a742910930a?w=400",
-        "https://images.unsplash.com/photo-1553451310-1416336a3cca?w=400",
-        "https://images.unsplash.com/photo-1521138054413-5a47d349b7af?w=400",
-        "https://images.unsplash.com/photo-1547347298-4074fc3086f0?w=400",
-        "https://images.unsplash.com/photo-1516224498413-84ecf3a1e7fd?w=400",
-        "https://images.unsplash.com/photo-1692197174597-1d85555c9b33?w=400",
-        "https://images.unsplash.com/photo-1606335544053-c43609e6155d?w=400",
-        "https://images.unsplash.com/photo-1612872087720-bb876e2e67d1?w=400",
-        "https://images.unsplash.com/photo-1587280501635-68a0e82cd5ff?w=400",
-        "https://images.unsplash.com/photo-1593786481097-7e512db2cada?w=400",
-    ]
-    
-    positions = ["S", "OH", "OPP", "MB", "L", "DS"]
-    position_names = {
-        "S": "Setter",
-        "OH": "Outside Hitter", 
-        "OPP": "Opposite Hitter",
-        "MB": "Middle Blocker",
-        "L": "Libero",
-        "DS": "Defensive Specialist"
-    }
-    
-    teams = [
-        "Phoenix Fire", "Wave Riders", "Thunder Storm", "Lightning Bolts", 
-        "Sky Hawks", "Ocean Warriors", "Desert Eagles", "Mountain Lions",
-        "Storm Chasers", "Coastal Crushers"
-    ]
-    
-    first_names = [
-        "Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Avery", "Quinn", "Blake", "Drew",
-        "Cameron", "Sage", "River", "Sky", "Phoenix", "Dakota", "Kai", "Rowan", "Hayden", "Parker",
-        "Emerson", "Finley", "Logan", "Peyton", "Reese", "Ryan", "Sawyer", "Spencer", "Tatum", "Wren",
-        "Charlie", "Jamie", "Ellis", "Kendall", "Dylan", "Harper", "Bailey", "Sidney", "Skyler", "Sam"
-    ]
-    
-    last_names = [
-        "Chen", "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
-        "Martinez", "Lee", "Kim", "Park", "Patel", "Singh", "Wang", "Liu", "Nguyen", "Anderson",
-        "Taylor", "Thomas", "Moore", "Jackson", "Martin", "Thompson", "White", "Harris", "Clark", "Lewis",
-        "Walker", "Hall", "Allen", "Young", "King", "Wright", "Lopez", "Hill", "Green", "Adams"
-    ]
-    
-    bios = [
-        "A powerful attacker with exceptional court vision and leadership skills.",
-        "Known for lightning-fast reflexes and pinpoint serving accuracy.",
-        "Brings years of international experience and clutch performance.",
-        "Defensive specialist with incredible agility and game-reading ability.",
-        "Rising star with explosive jumping ability and powerful spikes.",
-        "Veteran player known for consistent performance under pressure.",
-        "Technical expert with precise ball control and strategic thinking.",
-        "Dynamic all-around player with exceptional versatility.",
-        "Elite server with a devastating jump float technique.",
-        "Master of reading opponents and making game-changing plays.",
-        "Powerful blocker who dominates at the net.",
-        "Quick setter with exceptional court awareness.",
-        "Tenacious defender who never gives up on a ball.",
-        "Explosive attacker with a wide range of shots.",
-        "Steady presence who brings calm under pressure."
-    ]
-    
-    players = []
-    import random
-    random.seed(42)  # For consistent random generation
-    
-    # Ensure we have at least 5-6 players per position
-    num_players = random.randint(30, 35)
-    used_names = set()
-    used_jerseys = set()
-    
-    for i in range(num_players):
-        position = positions[i % len(positions)]
-        
-        # Generate unique name
-        attempts = 0
-        while attempts < 100:
-            name = f"{random.choice(first_names)} {random.choice(last_names)}"
-            if name not in used_names:
-                used_names.add(name)
-                break
-            attempts += 1
-        
-        # Generate unique jersey number
-        attempts = 0
-        while attempts < 100:
-            jersey = random.randint(1, 99)
-            if jersey not in used_jerseys:
-                used_jerseys.add(jersey)
-                break
-            attempts += 1
-        
-        # Credit costs vary by position (strategically distributed)
-        if position == "S":
-            credit_cost = random.randint(12, 20)
-        elif position in ["OH", "OPP"]:
-            credit_cost = random.randint(15, 25)
-        elif position == "MB":
-            credit_cost = random.randint(10, 18)
-        elif position == "L":
-            credit_cost = random.randint(8, 15)
-        else:  # DS
-            credit_cost = random.randint(7, 14)
-        
-        player = {
-            "name": name,
-            "jerseyNumber": jersey,
-            "position": position,
-            "positionName": position_names[position],
-            "teamName": random.choice(teams),
-            "creditCost": credit_cost,
-            "bio": random.choice(bios),
-            "imageBase64": image_url_to_base64(image_urls[i % len(image_urls)]),
-            "stats": {
-                "matches": random.randint(50, 200),
-                "sets": random.randint(100, 500),
-                "kills_per_set": round(random.uniform(1.5, 5.5), 2),
-                "digs_per_set": round(random.uniform(1.0, 4.5), 2),
-                "blocks_per_set": round(random.uniform(0.3, 2.8), 2),
-                "aces_per_set": round(random.uniform(0.2, 1.8), 2)
-            }
-        }
-        players.append(player)
-    
-    await db.players.insert_many(players)
-    
-    # Count players by position
-    position_counts = {}
-    for pos in positions:
-        count = sum(1 for p in players if p["position"] == pos)
-        position_counts[position_names[pos]] = count
-    
+
+    # Delegate to the canonical seeder so the roster is generated in one place
+    players = await generate_players()
+
+    # Fire-and-forget write concern is fine for seed data and skips the ack round trip
+    await db.get_collection('players', write_concern=WriteConcern(w=0)).insert_many(players, ordered=False)
+    _players_cache.clear()
+
+    position_counts = count_by_position(players)
+
     return {
         "message": f"Successfully seeded {len(players)} players",
         "total": len(players),
@@ -488,6 +446,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_db_indexes():
+    # Cover the hot queries: player list filter/sort, auth lookup by email,
+    # and the per-user lineup upsert
+    await db.players.create_index([("position", 1), ("name", 1)])
+    await db.players.create_index([("position", 1), ("creditCost", 1)])
+    # Unique name doubles as a guard against double-seeding the roster
+    await db.players.create_index([("name", 1)], unique=True)
+    await db.players.create_index([("name_lower", 1)])
+    await db.users.create_index("email", unique=True)
+    await db.lineups.create_index("userId", unique=True)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    await client.close()
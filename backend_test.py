@@ -4,11 +4,42 @@ LOVB Fantasy Volleyball Backend API Test Suite
 Tests all backend endpoints as specified in the review request
 """
 
-import requests
+import argparse
+import httpx
+import io
 import json
 import sys
 import os
-from datetime import datetime
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from heapq import nlargest
+from operator import itemgetter
+from pathlib import Path
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# HTTP/2 lets the parallel read-only tests multiplex one connection, but it
+# needs the optional h2 package and a server that speaks it
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 # Get backend URL from frontend .env file
 def get_backend_url():
@@ -24,40 +55,160 @@ def get_backend_url():
 BASE_URL = get_backend_url()
 API_BASE = f"{BASE_URL}/api"
 
+# URL constants built once - the endpoints never change across a run
+U_SEED = f"{API_BASE}/seed-players"
+U_SIGNUP = f"{API_BASE}/auth/signup"
+U_SIGNIN = f"{API_BASE}/auth/signin"
+U_PLAYERS = f"{API_BASE}/players"
+U_PLAYERS_SETTERS = f"{API_BASE}/players?position=S"
+U_PLAYER = U_PLAYERS + "/{}"
+U_LINEUP = f"{API_BASE}/lineup"
+U_LINEUP_SAVE = f"{API_BASE}/lineup/save"
+
+POSITIONS = ("setter", "outsideHitter", "oppositeHitter", "middleBlocker",
+             "libero", "defensiveSpecialist")
+POSITION_CODES = ("S", "OH", "OPP", "MB", "L", "DS")
+
+# Required-field sets hoisted to module scope - set difference against
+# dict keys replaces the per-response field loops
+REQUIRED_AUTH_FIELDS = frozenset({"id", "email", "name", "token"})
+REQUIRED_PLAYER_LIST_FIELDS = frozenset({
+    "id", "name", "jerseyNumber", "position", "teamName",
+    "creditCost", "bio", "imageUrl", "stats"
+})
+REQUIRED_PLAYER_DETAIL_FIELDS = frozenset({
+    "id", "name", "jerseyNumber", "position", "teamName",
+    "creditCost", "bio", "imageBase64", "stats"
+})
+REQUIRED_STATS_FIELDS = frozenset({
+    "matches", "sets", "kills_per_set", "digs_per_set",
+    "blocks_per_set", "aces_per_set"
+})
+REQUIRED_LINEUP_FIELDS = frozenset({
+    "setter", "outsideHitter", "oppositeHitter", "middleBlocker",
+    "libero", "defensiveSpecialist", "creditsUsed", "remaining"
+})
+
+# Smoke subset for --fast inner-loop runs; auth always runs since the
+# authenticated tests need a token
+FAST_TESTS = frozenset({"Seed Players", "Auth Signup", "Auth Signin",
+                        "Get Players", "Save Valid Lineup"})
+
+# Cached JWT so repeat runs skip the signup/signin round-trips
+TOKEN_CACHE = Path.home() / ".lovb_test_token.json"
+
+def load_cached_token(email):
+    try:
+        with open(TOKEN_CACHE, 'r') as f:
+            cached = json.load(f)
+        if cached.get("email") == email and cached.get("url") == BASE_URL:
+            return cached.get("token")
+    except (OSError, ValueError):
+        pass
+    return None
+
+def save_cached_token(email, token):
+    try:
+        fd = os.open(TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)  # tighten perms even if the file pre-existed
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"email": email, "url": BASE_URL, "token": token}, f)
+    except OSError:
+        pass
+
+def parse_json(response):
+    """Parse a response body with orjson when available - the /api/players
+    payload is large enough that the parser choice is measurable"""
+    return _loads(response.content)
+
+def post_json(session, url, payload, **kwargs):
+    """POST a JSON body serialized with orjson, bypassing the stdlib dumps
+    that requests' json= keyword goes through"""
+    return session.post(url, content=_dumps(payload),
+                        headers={"Content-Type": "application/json"}, **kwargs)
+
+def _lineup_filled_count(data):
+    return sum(1 for pos in POSITIONS if data.get(pos) is not None)
+
+def warm_up_connection(session):
+    """Prime DNS and the keep-alive pool so the first timed test doesn't
+    pay resolution + handshake on top of its own work"""
+    parts = urlsplit(BASE_URL)
+    try:
+        socket.getaddrinfo(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+    except OSError:
+        pass
+    try:
+        # Any status is fine - we only want the socket in the pool
+        session.get(f"{BASE_URL}/", timeout=5)
+    except httpx.HTTPError:
+        pass
+
 class TestResults:
-    def __init__(self):
+    def __init__(self, reuse_user=False):
         self.results = []
         self.auth_token = None
-        self.test_user_email = "volleyball.fan@example.com"
+        # Fresh email per run so signup always exercises the clean path;
+        # --reuse-user keeps the fixed address (and the on-disk token cache)
+        self.reuse_user = reuse_user
+        if reuse_user:
+            self.test_user_email = "volleyball.fan@example.com"
+        else:
+            self.test_user_email = f"volleyball.fan+{int(time.time())}@example.com"
         self.test_user_password = "VolleyBall2024!"
         self.test_user_name = "Volleyball Fan"
-        
+        # One pooled client for the whole run - keep-alive instead of a
+        # fresh TCP handshake per request, multiplexed when HTTP/2 is up
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=_HTTP2,
+                retries=2,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            ),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip"},
+        )
+        # Summary bullets partitioned as results arrive - no extra passes
+        # over self.results at report time
+        self.passed_lines = []
+        self.failed_lines = []
+        # Player catalog fetched once after auth and shared by later tests
+        self.players = []
+        self.players_by_position = {}
+        # Guards results/printing when read-only tests run in parallel
+        self._log_lock = threading.Lock()
+
+    def set_auth_token(self, token):
+        self.auth_token = token
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
     def log(self, test_name, success, message, details=None):
         result = {
             "test": test_name,
             "success": success,
             "message": message,
-            "timestamp": datetime.now().isoformat(),
+            # Epoch ns - one clock read, formatted lazily if ever reported
+            "timestamp_ns": time.time_ns(),
             "details": details or {}
         }
-        self.results.append(result)
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}: {message}")
-        if details and not success:
-            print(f"   Details: {details}")
+        summary_line = f"  • {test_name}: {message}"
+        with self._log_lock:
+            self.results.append(result)
+            if success:
+                self.passed_lines.append(summary_line)
+            else:
+                self.failed_lines.append(summary_line)
+            print(f"{status} {test_name}: {message}")
+            if details and not success:
+                print(f"   Details: {details}")
     
-    def get_auth_headers(self):
-        if not self.auth_token:
-            return {}
-        return {"Authorization": f"Bearer {self.auth_token}"}
-
 def test_seed_players(test_results):
     """Test POST /api/seed-players"""
     try:
-        response = requests.post(f"{API_BASE}/seed-players", timeout=30)
+        response = test_results.session.post(U_SEED, timeout=30)
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             test_results.log(
                 "Seed Players", 
                 True, 
@@ -68,7 +219,7 @@ def test_seed_players(test_results):
                 "Seed Players", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Seed Players", False, f"Exception: {str(e)}")
@@ -82,40 +233,40 @@ def test_auth_signup(test_results):
             "name": test_results.test_user_name
         }
         
-        response = requests.post(f"{API_BASE}/auth/signup", json=payload, timeout=10)
+        response = post_json(test_results.session, U_SIGNUP, payload, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
-            required_fields = ["id", "email", "name", "token"]
-            
-            if all(field in data for field in required_fields):
-                test_results.auth_token = data["token"]
+            data = parse_json(response)
+            missing = REQUIRED_AUTH_FIELDS - data.keys()
+
+            if not missing:
+                test_results.set_auth_token(data["token"])
                 test_results.log(
-                    "Auth Signup", 
-                    True, 
+                    "Auth Signup",
+                    True,
                     f"User created successfully: {data['name']} ({data['email']})"
                 )
             else:
-                missing = [f for f in required_fields if f not in data]
                 test_results.log(
-                    "Auth Signup", 
-                    False, 
-                    f"Missing required fields: {missing}",
+                    "Auth Signup",
+                    False,
+                    f"Missing required fields: {sorted(missing)}",
                     {"response": data}
                 )
-        elif response.status_code == 400 and "already registered" in response.text:
-            # User already exists, try signin instead
+        elif (test_results.reuse_user and response.status_code == 400
+              and "already registered" in response.text):
+            # Fixed --reuse-user address may already exist; signin covers it
             test_results.log(
-                "Auth Signup", 
-                True, 
-                "User already exists (expected for repeated tests)"
+                "Auth Signup",
+                True,
+                "User already exists (expected with --reuse-user)"
             )
         else:
             test_results.log(
                 "Auth Signup", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Auth Signup", False, f"Exception: {str(e)}")
@@ -128,25 +279,24 @@ def test_auth_signin(test_results):
             "password": test_results.test_user_password
         }
         
-        response = requests.post(f"{API_BASE}/auth/signin", json=payload, timeout=10)
+        response = post_json(test_results.session, U_SIGNIN, payload, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
-            required_fields = ["id", "email", "name", "token"]
-            
-            if all(field in data for field in required_fields):
-                test_results.auth_token = data["token"]
+            data = parse_json(response)
+            missing = REQUIRED_AUTH_FIELDS - data.keys()
+
+            if not missing:
+                test_results.set_auth_token(data["token"])
                 test_results.log(
-                    "Auth Signin", 
-                    True, 
+                    "Auth Signin",
+                    True,
                     f"User signed in successfully: {data['name']} ({data['email']})"
                 )
             else:
-                missing = [f for f in required_fields if f not in data]
                 test_results.log(
-                    "Auth Signin", 
-                    False, 
-                    f"Missing required fields: {missing}",
+                    "Auth Signin",
+                    False,
+                    f"Missing required fields: {sorted(missing)}",
                     {"response": data}
                 )
         else:
@@ -154,93 +304,138 @@ def test_auth_signin(test_results):
                 "Auth Signin", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Auth Signin", False, f"Exception: {str(e)}")
 
+def fetch_players_once(test_results):
+    """Fetch the player catalog once so later tests reuse it instead of refetching"""
+    try:
+        response = test_results.session.get(U_PLAYERS, timeout=10)
+        if response.status_code == 200:
+            players = parse_json(response)
+            if isinstance(players, list):
+                test_results.players = players
+                test_results.players_by_position = {
+                    pos: [p for p in players if p["position"] == pos]
+                    for pos in POSITION_CODES
+                }
+    except Exception:
+        pass
+
+class _ChunkReader(io.RawIOBase):
+    """File-like wrapper over an iterator of byte chunks - ijson's sync API
+    wants something with read(), not a bare bytes iterable."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buf = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buf:
+            try:
+                self._buf = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+def _iter_players_response(response):
+    """Yield players from a streamed list response one at a time. With ijson
+    the body is scanned incrementally so a field-shape mismatch
+    short-circuits without materializing every player dict first."""
+    if ijson is not None:
+        # iter_bytes() yields decompressed chunks; the reader adapts them
+        # to the file-like interface ijson expects
+        yield from ijson.items(_ChunkReader(response.iter_bytes()), "item")
+    else:
+        response.read()
+        yield from _loads(response.content)
+
 def test_get_players(test_results):
     """Test GET /api/players"""
     try:
-        headers = test_results.get_auth_headers()
-        response = requests.get(f"{API_BASE}/players", headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            if isinstance(data, list) and len(data) > 0:
-                # Check if we have 35 players as expected
-                if len(data) == 35:
-                    # Verify player structure
-                    player = data[0]
-                    required_fields = ["id", "name", "jerseyNumber", "position", "teamName", 
-                                     "creditCost", "bio", "imageBase64", "stats"]
-                    
-                    if all(field in player for field in required_fields):
-                        # Check stats structure
-                        stats = player["stats"]
-                        stats_fields = ["matches", "sets", "kills_per_set", "digs_per_set", 
-                                      "blocks_per_set", "aces_per_set"]
-                        
-                        if all(field in stats for field in stats_fields):
-                            test_results.log(
-                                "Get Players", 
-                                True, 
-                                f"Retrieved {len(data)} players with complete data structure"
-                            )
-                        else:
-                            missing_stats = [f for f in stats_fields if f not in stats]
-                            test_results.log(
-                                "Get Players", 
-                                False, 
-                                f"Missing stats fields: {missing_stats}",
-                                {"sample_player": player}
-                            )
+        with test_results.session.stream("GET", U_PLAYERS, timeout=10) as response:
+            if response.status_code == 200:
+                count = 0
+                bad_player = None
+                missing = missing_stats = frozenset()
+                for player in _iter_players_response(response):
+                    count += 1
+                    missing = REQUIRED_PLAYER_LIST_FIELDS - player.keys()
+                    if missing:
+                        bad_player = player
+                        break
+                    missing_stats = REQUIRED_STATS_FIELDS - player["stats"].keys()
+                    if missing_stats:
+                        bad_player = player
+                        break
+
+                if count > 0 and not bad_player:
+                    # Check if we have 35 players as expected
+                    if count == 35:
+                        test_results.log(
+                            "Get Players",
+                            True,
+                            f"Retrieved {count} players with complete data structure"
+                        )
                     else:
-                        missing = [f for f in required_fields if f not in player]
                         test_results.log(
-                            "Get Players", 
-                            False, 
-                            f"Missing player fields: {missing}",
-                            {"sample_player": player}
+                            "Get Players",
+                            False,
+                            f"Expected 35 players, got {count}"
+                        )
+                elif bad_player:
+                    if missing:
+                        test_results.log(
+                            "Get Players",
+                            False,
+                            f"Missing player fields: {sorted(missing)}",
+                            {"sample_player": bad_player}
+                        )
+                    else:
+                        test_results.log(
+                            "Get Players",
+                            False,
+                            f"Missing stats fields: {sorted(missing_stats)}",
+                            {"sample_player": bad_player}
                         )
                 else:
                     test_results.log(
-                        "Get Players", 
-                        False, 
-                        f"Expected 35 players, got {len(data)}"
+                        "Get Players",
+                        False,
+                        "No players returned or invalid format"
                     )
+            elif response.status_code == 401:
+                test_results.log(
+                    "Get Players",
+                    False,
+                    "Authentication failed - token may be invalid"
+                )
             else:
+                response.read()
                 test_results.log(
-                    "Get Players", 
-                    False, 
-                    "No players returned or invalid format",
-                    {"response": data}
+                    "Get Players",
+                    False,
+                    f"Failed with status {response.status_code}",
+                    {"response": response.text[:512]}
                 )
-        elif response.status_code == 401:
-            test_results.log(
-                "Get Players", 
-                False, 
-                "Authentication failed - token may be invalid"
-            )
-        else:
-            test_results.log(
-                "Get Players", 
-                False, 
-                f"Failed with status {response.status_code}",
-                {"response": response.text}
-            )
     except Exception as e:
         test_results.log("Get Players", False, f"Exception: {str(e)}")
 
 def test_get_players_by_position(test_results):
     """Test GET /api/players?position=S"""
     try:
-        headers = test_results.get_auth_headers()
-        response = requests.get(f"{API_BASE}/players?position=S", headers=headers, timeout=10)
+        response = test_results.session.get(U_PLAYERS_SETTERS, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             
             if isinstance(data, list):
                 if len(data) > 0:
@@ -278,7 +473,7 @@ def test_get_players_by_position(test_results):
                 "Get Players by Position", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Get Players by Position", False, f"Exception: {str(e)}")
@@ -286,36 +481,24 @@ def test_get_players_by_position(test_results):
 def test_get_single_player(test_results):
     """Test GET /api/players/{player_id}"""
     try:
-        # First get a player ID
-        headers = test_results.get_auth_headers()
-        players_response = requests.get(f"{API_BASE}/players", headers=headers, timeout=10)
-        
-        if players_response.status_code != 200:
-            test_results.log(
-                "Get Single Player", 
-                False, 
-                "Could not fetch players list to get player ID"
-            )
-            return
-        
-        players = players_response.json()
+        # Reuse the catalog fetched once in main() instead of refetching
+        players = test_results.players
         if not players:
             test_results.log(
-                "Get Single Player", 
-                False, 
+                "Get Single Player",
+                False,
                 "No players available to test single player endpoint"
             )
             return
-        
+
         player_id = players[0]["id"]
-        response = requests.get(f"{API_BASE}/players/{player_id}", headers=headers, timeout=10)
+        response = test_results.session.get(U_PLAYER.format(player_id), timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
-            required_fields = ["id", "name", "jerseyNumber", "position", "teamName", 
-                             "creditCost", "bio", "imageBase64", "stats"]
-            
-            if all(field in data for field in required_fields):
+            data = parse_json(response)
+            missing = REQUIRED_PLAYER_DETAIL_FIELDS - data.keys()
+
+            if not missing:
                 if data["id"] == player_id:
                     test_results.log(
                         "Get Single Player", 
@@ -329,11 +512,10 @@ def test_get_single_player(test_results):
                         f"Player ID mismatch: requested {player_id}, got {data['id']}"
                     )
             else:
-                missing = [f for f in required_fields if f not in data]
                 test_results.log(
-                    "Get Single Player", 
-                    False, 
-                    f"Missing fields: {missing}",
+                    "Get Single Player",
+                    False,
+                    f"Missing fields: {sorted(missing)}",
                     {"response": data}
                 )
         elif response.status_code == 404:
@@ -347,7 +529,7 @@ def test_get_single_player(test_results):
                 "Get Single Player", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Get Single Player", False, f"Exception: {str(e)}")
@@ -355,20 +537,16 @@ def test_get_single_player(test_results):
 def test_get_empty_lineup(test_results):
     """Test GET /api/lineup (should be empty initially)"""
     try:
-        headers = test_results.get_auth_headers()
-        response = requests.get(f"{API_BASE}/lineup", headers=headers, timeout=10)
+        response = test_results.session.get(U_LINEUP, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
-            expected_fields = ["setter", "outsideHitter", "oppositeHitter", "middleBlocker", 
-                             "libero", "defensiveSpecialist", "creditsUsed", "remaining"]
-            
-            if all(field in data for field in expected_fields):
+            data = parse_json(response)
+            missing = REQUIRED_LINEUP_FIELDS - data.keys()
+
+            if not missing:
                 # Check if lineup is empty
-                positions = ["setter", "outsideHitter", "oppositeHitter", "middleBlocker", 
-                           "libero", "defensiveSpecialist"]
-                all_empty = all(data[pos] is None for pos in positions)
-                
+                all_empty = not any(map(data.get, POSITIONS))
+
                 if all_empty and data["creditsUsed"] == 0 and data["remaining"] == 100:
                     test_results.log(
                         "Get Empty Lineup", 
@@ -383,11 +561,10 @@ def test_get_empty_lineup(test_results):
                         {"lineup": data}
                     )
             else:
-                missing = [f for f in expected_fields if f not in data]
                 test_results.log(
-                    "Get Empty Lineup", 
-                    False, 
-                    f"Missing fields: {missing}",
+                    "Get Empty Lineup",
+                    False,
+                    f"Missing fields: {sorted(missing)}",
                     {"response": data}
                 )
         else:
@@ -395,7 +572,7 @@ def test_get_empty_lineup(test_results):
                 "Get Empty Lineup", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Get Empty Lineup", False, f"Exception: {str(e)}")
@@ -403,45 +580,32 @@ def test_get_empty_lineup(test_results):
 def test_save_valid_lineup(test_results):
     """Test POST /api/lineup/save with valid 6-player lineup"""
     try:
-        # First get players by position to build a valid lineup
-        headers = test_results.get_auth_headers()
-        
-        positions = ["S", "OH", "OPP", "MB", "L", "DS"]
+        # Build a valid lineup from the cached per-position catalog -
+        # cheapest player per position, then one budget check at the end
+
         lineup_players = {}
-        total_cost = 0
-        
-        for pos in positions:
-            response = requests.get(f"{API_BASE}/players?position={pos}", headers=headers, timeout=10)
-            if response.status_code != 200:
-                test_results.log(
-                    "Save Valid Lineup", 
-                    False, 
-                    f"Could not fetch {pos} players"
-                )
-                return
-            
-            players = response.json()
+
+        for pos in POSITION_CODES:
+            players = test_results.players_by_position.get(pos, [])
             if not players:
                 test_results.log(
-                    "Save Valid Lineup", 
-                    False, 
+                    "Save Valid Lineup",
+                    False,
                     f"No {pos} players available"
                 )
                 return
-            
-            # Find cheapest player for this position to stay under budget
-            cheapest = min(players, key=lambda p: p["creditCost"])
-            if total_cost + cheapest["creditCost"] <= 100:
-                lineup_players[pos] = cheapest
-                total_cost += cheapest["creditCost"]
-            else:
-                test_results.log(
-                    "Save Valid Lineup", 
-                    False, 
-                    f"Cannot build lineup under 100 credits (current: {total_cost})"
-                )
-                return
-        
+            lineup_players[pos] = min(players, key=itemgetter("creditCost"))
+
+        total_cost = sum(p["creditCost"] for p in lineup_players.values())
+        if total_cost > 100:
+            test_results.log(
+                "Save Valid Lineup",
+                False,
+                f"Cannot build lineup under 100 credits (cheapest: {total_cost})"
+            )
+            return
+
+
         # Build lineup payload
         lineup_payload = {
             "setter": lineup_players["S"]["id"],
@@ -452,10 +616,10 @@ def test_save_valid_lineup(test_results):
             "defensiveSpecialist": lineup_players["DS"]["id"]
         }
         
-        response = requests.post(f"{API_BASE}/lineup/save", json=lineup_payload, headers=headers, timeout=10)
+        response = post_json(test_results.session, U_LINEUP_SAVE, lineup_payload, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             if "message" in data and data.get("creditsUsed") == total_cost:
                 test_results.log(
                     "Save Valid Lineup", 
@@ -476,7 +640,7 @@ def test_save_valid_lineup(test_results):
                 "Save Valid Lineup", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text, "payload": lineup_payload}
+                {"response": response.text[:512], "payload": lineup_payload}
             )
     except Exception as e:
         test_results.log("Save Valid Lineup", False, f"Exception: {str(e)}")
@@ -484,18 +648,14 @@ def test_save_valid_lineup(test_results):
 def test_get_saved_lineup(test_results):
     """Test GET /api/lineup after saving"""
     try:
-        headers = test_results.get_auth_headers()
-        response = requests.get(f"{API_BASE}/lineup", headers=headers, timeout=10)
+        response = test_results.session.get(U_LINEUP, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             
             # Check if lineup is populated
-            positions = ["setter", "outsideHitter", "oppositeHitter", "middleBlocker", 
-                       "libero", "defensiveSpecialist"]
-            
-            filled_positions = sum(1 for pos in positions if data.get(pos) is not None)
-            
+            filled_positions = _lineup_filled_count(data)
+
             if filled_positions == 6:
                 expected_cost = getattr(test_results, 'saved_lineup_cost', None)
                 actual_cost = data.get("creditsUsed", 0)
@@ -524,7 +684,7 @@ def test_get_saved_lineup(test_results):
                 "Get Saved Lineup", 
                 False, 
                 f"Failed with status {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Get Saved Lineup", False, f"Exception: {str(e)}")
@@ -532,29 +692,19 @@ def test_get_saved_lineup(test_results):
 def test_save_lineup_budget_exceeded(test_results):
     """Test POST /api/lineup/save with budget > 100 credits"""
     try:
-        headers = test_results.get_auth_headers()
-        
-        # Get expensive players to exceed budget
-        response = requests.get(f"{API_BASE}/players?sortBy=creditCost", headers=headers, timeout=10)
-        if response.status_code != 200:
-            test_results.log(
-                "Save Lineup Budget Exceeded", 
-                False, 
-                "Could not fetch players for budget test"
-            )
-            return
-        
-        players = response.json()
+        # Use the cached catalog - picking the top 6 by cost needs no
+        # extra HTTP call or full sort
+        players = test_results.players
         if len(players) < 6:
             test_results.log(
-                "Save Lineup Budget Exceeded", 
-                False, 
+                "Save Lineup Budget Exceeded",
+                False,
                 "Not enough players to test budget exceeded"
             )
             return
-        
+
         # Try to use the most expensive players
-        expensive_players = sorted(players, key=lambda p: p["creditCost"], reverse=True)[:6]
+        expensive_players = nlargest(6, players, key=itemgetter("creditCost"))
         total_cost = sum(p["creditCost"] for p in expensive_players)
         
         if total_cost <= 100:
@@ -575,10 +725,10 @@ def test_save_lineup_budget_exceeded(test_results):
             "defensiveSpecialist": expensive_players[5]["id"]
         }
         
-        response = requests.post(f"{API_BASE}/lineup/save", json=lineup_payload, headers=headers, timeout=10)
+        response = post_json(test_results.session, U_LINEUP_SAVE, lineup_payload, timeout=10)
         
         if response.status_code == 400:
-            data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {"detail": response.text}
+            data = parse_json(response) if response.headers.get('content-type', '').startswith('application/json') else {"detail": response.text[:512]}
             if "budget" in str(data).lower() or "exceed" in str(data).lower():
                 test_results.log(
                     "Save Lineup Budget Exceeded", 
@@ -597,7 +747,7 @@ def test_save_lineup_budget_exceeded(test_results):
                 "Save Lineup Budget Exceeded", 
                 False, 
                 f"Expected 400 error, got {response.status_code}",
-                {"response": response.text, "total_cost": total_cost}
+                {"response": response.text[:512], "total_cost": total_cost}
             )
     except Exception as e:
         test_results.log("Save Lineup Budget Exceeded", False, f"Exception: {str(e)}")
@@ -605,19 +755,9 @@ def test_save_lineup_budget_exceeded(test_results):
 def test_save_incomplete_lineup(test_results):
     """Test POST /api/lineup/save with only 5 players"""
     try:
-        headers = test_results.get_auth_headers()
-        
-        # Get some players
-        response = requests.get(f"{API_BASE}/players", headers=headers, timeout=10)
-        if response.status_code != 200:
-            test_results.log(
-                "Save Incomplete Lineup", 
-                False, 
-                "Could not fetch players for incomplete lineup test"
-            )
-            return
-        
-        players = response.json()
+
+        # Reuse the cached player catalog
+        players = test_results.players
         if len(players) < 5:
             test_results.log(
                 "Save Incomplete Lineup", 
@@ -636,10 +776,10 @@ def test_save_incomplete_lineup(test_results):
             # defensiveSpecialist intentionally missing
         }
         
-        response = requests.post(f"{API_BASE}/lineup/save", json=lineup_payload, headers=headers, timeout=10)
+        response = post_json(test_results.session, U_LINEUP_SAVE, lineup_payload, timeout=10)
         
         if response.status_code == 400:
-            data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {"detail": response.text}
+            data = parse_json(response) if response.headers.get('content-type', '').startswith('application/json') else {"detail": response.text[:512]}
             if "6 positions" in str(data) or "must be filled" in str(data):
                 test_results.log(
                     "Save Incomplete Lineup", 
@@ -658,60 +798,125 @@ def test_save_incomplete_lineup(test_results):
                 "Save Incomplete Lineup", 
                 False, 
                 f"Expected 400 error, got {response.status_code}",
-                {"response": response.text}
+                {"response": response.text[:512]}
             )
     except Exception as e:
         test_results.log("Save Incomplete Lineup", False, f"Exception: {str(e)}")
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="LOVB backend API test suite")
+    parser.add_argument("--fast", action="store_true",
+                        help="run only the smoke subset for quick iteration")
+    parser.add_argument("--only", metavar="NAME,NAME",
+                        help="comma-separated test names to run (auth still "
+                             "runs when a token is needed)")
+    parser.add_argument("--reuse-user", action="store_true",
+                        help="sign in as the fixed test user (and reuse the "
+                             "cached token) instead of a fresh one per run")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.only:
+        selected = frozenset(name.strip() for name in args.only.split(","))
+    elif args.fast:
+        selected = FAST_TESTS
+    else:
+        selected = None
+
+    def wants(name):
+        return selected is None or name in selected
+
     print("🏐 LOVB Fantasy Volleyball Backend API Test Suite")
     print("=" * 60)
     print(f"Testing backend at: {API_BASE}")
+    if selected is not None:
+        print(f"Selected tests: {', '.join(sorted(selected))}")
     print()
-    
-    test_results = TestResults()
-    
+
+    test_results = TestResults(reuse_user=args.reuse_user)
+    warm_up_connection(test_results.session)
+
     # Run all tests in sequence
-    test_seed_players(test_results)
-    test_auth_signup(test_results)
-    test_auth_signin(test_results)
-    
+    if wants("Seed Players"):
+        test_seed_players(test_results)
+
+    # With --reuse-user, a token cached by a previous run that still
+    # validates skips the signup and signin round-trips entirely
+    cached_token = load_cached_token(test_results.test_user_email) if args.reuse_user else None
+    if cached_token:
+        test_results.set_auth_token(cached_token)
+        try:
+            probe_ok = test_results.session.get(U_LINEUP, timeout=10).status_code == 200
+        except Exception:
+            # Any probe failure just means we re-authenticate normally
+            probe_ok = False
+        if probe_ok:
+            test_results.log(
+                "Auth (cached)",
+                True,
+                "Reused cached token from previous run"
+            )
+        else:
+            test_results.auth_token = None
+            del test_results.session.headers["Authorization"]
+
+    if not test_results.auth_token:
+        test_auth_signup(test_results)
+        test_auth_signin(test_results)
+        if args.reuse_user and test_results.auth_token:
+            save_cached_token(test_results.test_user_email, test_results.auth_token)
+
     if test_results.auth_token:
-        test_get_players(test_results)
-        test_get_players_by_position(test_results)
-        test_get_single_player(test_results)
-        test_get_empty_lineup(test_results)
-        test_save_valid_lineup(test_results)
-        test_get_saved_lineup(test_results)
-        test_save_lineup_budget_exceeded(test_results)
-        test_save_incomplete_lineup(test_results)
+        fetch_players_once(test_results)
+        # These four only read state, so run them concurrently on the
+        # shared session - the lineup tests below still run in order
+        # because they depend on each other's writes
+        read_only_tests = [
+            fn for name, fn in (
+                ("Get Players", test_get_players),
+                ("Get Players by Position", test_get_players_by_position),
+                ("Get Single Player", test_get_single_player),
+                ("Get Empty Lineup", test_get_empty_lineup),
+            ) if wants(name)
+        ]
+        if read_only_tests:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for future in [executor.submit(t, test_results) for t in read_only_tests]:
+                    future.result()
+        for name, fn in (
+            ("Save Valid Lineup", test_save_valid_lineup),
+            ("Get Saved Lineup", test_get_saved_lineup),
+            ("Save Lineup Budget Exceeded", test_save_lineup_budget_exceeded),
+            ("Save Incomplete Lineup", test_save_incomplete_lineup),
+        ):
+            if wants(name):
+                fn(test_results)
     else:
         print("❌ Skipping authenticated tests - no auth token available")
     
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 TEST SUMMARY")
-    print("=" * 60)
-    
-    passed = sum(1 for r in test_results.results if r["success"])
-    total = len(test_results.results)
-    
-    print(f"Total Tests: {total}")
-    print(f"Passed: {passed}")
-    print(f"Failed: {total - passed}")
-    print(f"Success Rate: {(passed/total*100):.1f}%")
-    
-    if total - passed > 0:
-        print("\n❌ FAILED TESTS:")
-        for result in test_results.results:
-            if not result["success"]:
-                print(f"  • {result['test']}: {result['message']}")
-    
-    print("\n✅ PASSED TESTS:")
-    for result in test_results.results:
-        if result["success"]:
-            print(f"  • {result['test']}: {result['message']}")
-    
+    # Summary - buffer into one string and emit with a single write; the
+    # pass/fail bullets were partitioned as the results came in
+    passed_lines = test_results.passed_lines
+    failed_lines = test_results.failed_lines
+    passed = len(passed_lines)
+    total = passed + len(failed_lines)
+
+    lines = [
+        "",
+        "=" * 60,
+        "📊 TEST SUMMARY",
+        "=" * 60,
+        f"Total Tests: {total}",
+        f"Passed: {passed}",
+        f"Failed: {total - passed}",
+        f"Success Rate: {(passed/total*100):.1f}%",
+    ]
+    if failed_lines:
+        lines += ["", "❌ FAILED TESTS:", *failed_lines]
+    lines += ["", "✅ PASSED TESTS:", *passed_lines, ""]
+    sys.stdout.write("\n".join(lines))
+
     return test_results
 
 if __name__ == "__main__":
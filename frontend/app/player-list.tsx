@@ -141,9 +141,9 @@ export default function PlayerList() {
         onPress={() => handleSelectPlayer(item)}
         disabled={isSelected && !params.position}
       >
-        {item.imageBase64 ? (
+        {item.imageUrl || item.imageBase64 ? (
           <Image
-            source={{ uri: `data:image/jpeg;base64,${item.imageBase64}` }}
+            source={{ uri: item.imageUrl || `data:image/jpeg;base64,${item.imageBase64}` }}
             style={styles.playerImage}
           />
         ) : (
@@ -271,9 +271,9 @@ export default function PlayerList() {
                 <Ionicons name="close" size={28} color="#FFFFFF" />
               </TouchableOpacity>
 
-              {selectedPlayer.imageBase64 ? (
+              {selectedPlayer.imageUrl || selectedPlayer.imageBase64 ? (
                 <Image
-                  source={{ uri: `data:image/jpeg;base64,${selectedPlayer.imageBase64}` }}
+                  source={{ uri: selectedPlayer.imageUrl || `data:image/jpeg;base64,${selectedPlayer.imageBase64}` }}
                   style={styles.modalImage}
                 />
               ) : (
@@ -235,9 +235,9 @@ export default function TeamBuilder() {
                     <View style={styles.creditBadge}>
                       <Text style={styles.creditText}>{lineup[position.key]!.creditCost}</Text>
                     </View>
-                    {lineup[position.key]!.imageBase64 ? (
+                    {lineup[position.key]!.imageUrl || lineup[position.key]!.imageBase64 ? (
                       <Image
-                        source={{ uri: `data:image/jpeg;base64,${lineup[position.key]!.imageBase64}` }}
+                        source={{ uri: lineup[position.key]!.imageUrl || `data:image/jpeg;base64,${lineup[position.key]!.imageBase64}` }}
                         style={styles.playerAvatar}
                       />
                     ) : (
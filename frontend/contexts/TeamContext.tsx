@@ -18,7 +18,8 @@ export interface Player {
   teamName: string;
   creditCost: number;
   bio: string;
-  imageBase64: string;
+  imageBase64?: string;
+  imageUrl?: string;
   stats: PlayerStats;
 }
 